@@ -7,28 +7,27 @@ Supports court filtering, date ranges, PDF downloads, and pagination.
 Author: Optimized version with improved performance and error handling
 """
 
+from __future__ import annotations
+
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import (
-    SessionNotCreatedException, TimeoutException,
-    NoSuchElementException, WebDriverException
-)
-from selenium.webdriver.common.by import By
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit, urlunsplit
+import base64
+import functools
 import platform
 import os
+import queue
 import re
+import shutil
+import sqlite3
+import tempfile
 import time
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple, Callable
+from typing import List, Optional, Tuple, Callable
 
 # Configure logging for debugging
 logging.basicConfig(
@@ -36,11 +35,15 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-# Constants for URL patterns to exclude from results
-EXCLUDED_PATTERNS = [
-    r"/t/home", r"/t/citator", r"/t/myJade", r"/t/panel",
-    r"/t/feedback", r"/t/help", r"#"
-]
+# Literal URL substrings to exclude from results; plain `in` checks beat
+# the regex engine since none of these need metacharacters
+EXCLUDED_LITERALS = (
+    "/t/home", "/t/citator", "/t/myJade", "/t/panel",
+    "/t/feedback", "/t/help", "#"
+)
+
+# Precompiled at import so the pagination check is a single C-level match
+_PAGE_RE = re.compile(r"You are on page \d+ of (\d+)")
 
 # Available court options for filtering
 COURTS = [
@@ -62,15 +65,197 @@ COURTS = [
     "Federal Circuit and Family Court of Australia - Division 1 Appellate Jurisdiction (FedCFamC1A)"
 ]
 
+# Chrome flags shared by the main driver and download workers
+CHROME_ARGS = (
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-images'  # Speed up loading
+)
+
 # Default timeout values
 DEFAULT_WAIT_TIME = 5
 DEFAULT_PAGE_LOAD_TIMEOUT = 60
 MAX_RETRY_ATTEMPTS = 3
+DOWNLOAD_WORKERS = 4
+
+# Browser health limits: recycle a pool worker after this many
+# consecutive download failures, and restart the search driver once
+# chromedriver and its children exceed this much RSS
+MAX_CONSECUTIVE_FAILURES = 3
+DRIVER_RSS_LIMIT = 2 * 1024 ** 3  # 2 GB
+
+# Selenium, selectolax, requests and psutil cost several hundred ms of
+# import time combined; loading them lazily lets the Tk window appear
+# right away, and none of them are needed until a search actually
+# starts. WAIT_LINKS is defined here too since it depends on the
+# deferred modules.
+_HEAVY_IMPORTS_LOADED = False
+
+
+def _load_heavy_imports():
+    """Import the scraping dependencies on first use"""
+    global _HEAVY_IMPORTS_LOADED
+    if _HEAVY_IMPORTS_LOADED:
+        return
+
+    global webdriver, Options, WebDriverWait, EC, By
+    global SessionNotCreatedException, TimeoutException
+    global NoSuchElementException, WebDriverException
+    global LexborHTMLParser, psutil, requests, requests_cache
+    global WAIT_LINKS
+
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import (
+        SessionNotCreatedException, TimeoutException,
+        NoSuchElementException, WebDriverException
+    )
+    from selenium.webdriver.common.by import By
+    from selectolax.lexbor import LexborHTMLParser
+    import psutil
+    import requests
+    import requests_cache
+
+    # Locator for the case-link anchors; doubles as the page-ready signal
+    WAIT_LINKS = (By.CSS_SELECTOR, _LINK_SELECTOR)
+
+    _HEAVY_IMPORTS_LOADED = True
+
+
+# The one selector that identifies case-link anchors; every wait,
+# query and parse keys off this
+_LINK_SELECTOR = 'a.gwt-Hyperlink.alcina-NoHistory'
+
+# Run the queries inside the page so only the answers cross the
+# chromedriver wire, not megabytes of serialized DOM
+_LINKS_JS = (
+    "return Array.from("
+    f"document.querySelectorAll('{_LINK_SELECTOR}'))"
+    ".map(a => a.getAttribute('href')).filter(Boolean)"
+)
+_PAGES_JS = (
+    "const m = document.body.innerText.match(/You are on page \\d+ of (\\d+)/);"
+    "return m ? parseInt(m[1], 10) : 1"
+)
+
+
+def _format_elapsed(total_seconds: int) -> str:
+    """Format a second count as 'Xh Ym Zs' with empty leading units"""
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def _canon(link: str) -> str:
+    """Canonical dedup key for a case link
+
+    Drops the querystring, fragment and trailing slash so links that
+    differ only in those don't survive dedup as near-duplicates.
+    """
+    parts = urlsplit(link)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/'), '', ''))
+
+
+def _case_filename(url: str) -> str:
+    """Derive a filesystem-safe PDF filename from a case URL"""
+    slug = url.rstrip('/').rsplit('/', 1)[-1]
+    slug = re.sub(r'[^A-Za-z0-9._-]+', '_', slug).strip('_') or 'case'
+    return f"{slug}.pdf"
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_profile_dir() -> str:
+    """Get the default Chrome profile directory based on OS"""
+    home = os.path.expanduser("~")
+    system = platform.system()
+
+    profile_paths = {
+        'Windows': os.path.join(home, 'AppData', 'Local', 'Google', 'Chrome', 'User Data'),
+        'Darwin': os.path.join(home, 'Library', 'Application Support', 'Google', 'Chrome'),
+        'Linux': os.path.join(home, '.config', 'google-chrome')
+    }
+
+    return profile_paths.get(system, profile_paths['Linux'])
 
 
-@dataclass
+def _make_opts(config: SearchConfig, user_profile: Optional[str] = None) -> 'Options':
+    """Compose Chrome options for the search driver
+
+    Shared by the primary and fallback startup paths so the argument
+    lists only live in one place.
+    """
+    opts = Options()
+    # Return from driver.get at DOMContentLoaded instead of full load
+    opts.page_load_strategy = 'eager'
+
+    for option in CHROME_ARGS:
+        opts.add_argument(option)
+
+    # Headless mode
+    if config.headless:
+        opts.add_argument("--headless=new")
+    else:
+        opts.add_argument("--start-maximized")
+
+    # The search driver only ever reads result anchors and pagination
+    # text, so skip fetching and rendering images, styles and fonts
+    # entirely. PDF workers build their own options and keep these on.
+    opts.add_argument('--blink-settings=imagesEnabled=false')
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    }
+
+    # PDF download configuration
+    if config.download_pdfs and config.download_dir:
+        prefs.update({
+            "plugins.always_open_pdf_externally": True,
+            "download.prompt_for_download": False,
+            "download.default_directory": os.path.abspath(config.download_dir)
+        })
+    opts.add_experimental_option("prefs", prefs)
+
+    if user_profile:
+        opts.add_argument(f"--user-data-dir={user_profile}")
+
+    return opts
+
+
+@functools.lru_cache(maxsize=None)
+def format_date_for_jade(date_str: str) -> Optional[str]:
+    """Convert YYYY-MM-DD format to Jade.io date format"""
+    if not date_str:
+        return None
+
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        return dt.strftime("%Y%m%dT000000000+0800")
+    except ValueError as e:
+        logging.warning(f"Invalid date format: {date_str} - {e}")
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class SearchConfig:
-    """Configuration class for search parameters"""
+    """Configuration class for search parameters
+
+    Frozen so a config can never drift mid-run; use dataclasses.replace
+    to derive a variant. Slots drop the per-instance __dict__ and make
+    the frequent attribute reads in the scrape loops cheaper.
+    """
     query: str
     court_name: Optional[str] = None
     start_date: Optional[str] = None
@@ -80,12 +265,15 @@ class SearchConfig:
     wait_time: int = DEFAULT_WAIT_TIME
     download_pdfs: bool = False
     download_dir: Optional[str] = None
+    use_cache: bool = True
     progress_callback: Optional[Callable[[str], None]] = None
+    link_callback: Optional[Callable[[str], None]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TimingInfo:
-    """Class to track timing information"""
+    """Class to track timing information (end_time is set when a phase
+    finishes, so this one stays mutable)"""
     start_time: datetime
     end_time: Optional[datetime] = None
 
@@ -96,16 +284,145 @@ class TimingInfo:
 
     @property
     def elapsed_str(self) -> str:
-        total_seconds = int(self.elapsed.total_seconds())
-        minutes, seconds = divmod(total_seconds, 60)
-        hours, minutes = divmod(minutes, 60)
+        return _format_elapsed(int(self.elapsed.total_seconds()))
+
+
+class CaseCache:
+    """Persistent record of already-downloaded case PDFs
+
+    A small SQLite file inside the download folder maps case URL to the
+    downloaded path, so re-running a search (or resuming a partial run)
+    skips every case whose PDF is already on disk.
+    """
+
+    def __init__(self, download_dir: str):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            os.path.join(download_dir, '.jade_cache.db'),
+            check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cases "
+            "(url TEXT PRIMARY KEY, path TEXT, ts INTEGER)")
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the recorded download path for url, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT path FROM cases WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, url: str, path: str):
+        """Record a successful download"""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cases VALUES (?, ?, ?)",
+                (url, path, int(time.time())))
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+@dataclass(slots=True)
+class DriverSession:
+    """One pooled browser plus the per-worker state it carries"""
+    driver: object
+    wait: object
+    download_dir: str
+    profile_dir: str = ''
+    failures: int = 0
+
+
+class DriverPool:
+    """Fixed pool of pre-initialized Chrome instances for PDF workers
+
+    Each driver gets its own download subfolder so concurrent downloads
+    cannot clobber each other; close() merges them back into the
+    requested directory.
+    """
+
+    def __init__(self, scraper: 'JadeScraper', config: SearchConfig, size: int):
+        self.scraper = scraper
+        self.config = config
+        self.sessions: queue.Queue = queue.Queue()
+        self.all_sessions: List[DriverSession] = []
+
+        try:
+            for i in range(size):
+                worker_dir = os.path.join(config.download_dir, f".worker_{i}")
+                os.makedirs(worker_dir, exist_ok=True)
+
+                driver, profile_dir = scraper.create_download_driver(
+                    config, worker_dir)
+                session = DriverSession(
+                    driver=driver,
+                    wait=WebDriverWait(driver, config.wait_time),
+                    download_dir=worker_dir,
+                    profile_dir=profile_dir)
+                self.sessions.put(session)
+                self.all_sessions.append(session)
+        except (WebDriverException, OSError):
+            # Worker k failed — whether Chrome startup or the makedirs/
+            # mkdtemp around it — quit the k drivers already built so
+            # they don't outlive the pool the caller never got
+            self.close()
+            raise
+
+    def acquire(self) -> DriverSession:
+        """Take a free driver, blocking until one is available"""
+        return self.sessions.get()
+
+    def release(self, session: DriverSession):
+        """Return a driver to the pool, recycling it after a failure streak
+
+        A worker that keeps failing is usually wedged (hung renderer,
+        dead session); replace its browser with a fresh one rather than
+        feeding it more downloads.
+        """
+        if session.failures >= MAX_CONSECUTIVE_FAILURES:
+            logging.info("Recycling worker driver after repeated failures")
+            try:
+                session.driver.quit()
+            except Exception as e:
+                logging.warning(f"Error closing worker driver: {e}")
+            shutil.rmtree(session.profile_dir, ignore_errors=True)
+
+            try:
+                driver, profile_dir = self.scraper.create_download_driver(
+                    self.config, session.download_dir)
+            except (WebDriverException, OSError) as e:
+                # Keep the session in rotation; its downloads will fail
+                # fast and the next release retries the recycle
+                logging.warning(f"Could not recycle worker driver: {e}")
+            else:
+                session.driver = driver
+                session.wait = WebDriverWait(driver, self.config.wait_time)
+                session.profile_dir = profile_dir
+                session.failures = 0
+
+        self.sessions.put(session)
+
+    def close(self, merge_into: Optional[str] = None):
+        """Quit every driver and merge worker downloads into merge_into"""
+        for session in self.all_sessions:
+            try:
+                session.driver.quit()
+            except Exception as e:
+                logging.warning(f"Error closing worker driver: {e}")
+            shutil.rmtree(session.profile_dir, ignore_errors=True)
 
-        if hours > 0:
-            return f"{hours}h {minutes}m {seconds}s"
-        elif minutes > 0:
-            return f"{minutes}m {seconds}s"
-        else:
-            return f"{seconds}s"
+        if merge_into:
+            for session in self.all_sessions:
+                try:
+                    for name in os.listdir(session.download_dir):
+                        shutil.move(
+                            os.path.join(session.download_dir, name),
+                            os.path.join(merge_into, name))
+                    os.rmdir(session.download_dir)
+                except OSError as e:
+                    logging.warning(
+                        f"Error merging downloads from {session.download_dir}: {e}")
 
 
 class JadeScraper:
@@ -114,39 +431,18 @@ class JadeScraper:
     def __init__(self):
         self.driver = None
         self.wait = None
+        self.session = None
         self.search_timer = None
         self.download_timers = {}
         self.total_timer = None
         self.browser_start_time = None
         self.browser_restart_interval = 1800  # 1 half hour in seconds
+        self.driver_config_key = None
+        self._url_suffix = None
+        self._driver_lock = threading.Lock()
 
-    def get_default_profile_dir(self) -> str:
-        """Get the default Chrome profile directory based on OS"""
-        home = os.path.expanduser("~")
-        system = platform.system()
-
-        profile_paths = {
-            'Windows': os.path.join(home, 'AppData', 'Local', 'Google', 'Chrome', 'User Data'),
-            'Darwin': os.path.join(home, 'Library', 'Application Support', 'Google', 'Chrome'),
-            'Linux': os.path.join(home, '.config', 'google-chrome')
-        }
-
-        return profile_paths.get(system, profile_paths['Linux'])
-
-    def format_date_for_jade(self, date_str: str) -> Optional[str]:
-        """Convert YYYY-MM-DD format to Jade.io date format"""
-        if not date_str:
-            return None
-
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.strftime("%Y%m%dT000000000+0800")
-        except ValueError as e:
-            logging.warning(f"Invalid date format: {date_str} - {e}")
-            return None
-
-    def build_search_url(self, config: SearchConfig, page: int = 0) -> str:
-        """Build the search URL with all parameters"""
+    def _prepare_url_template(self, config: SearchConfig) -> str:
+        """Build the page-invariant part of the search URL once per run"""
         # Encode search terms
         encoded_terms = [quote_plus(term) for term in config.query.split()]
         query_part = '+AND+'.join(
@@ -155,174 +451,420 @@ class JadeScraper:
         # Build date filter
         date_part = ""
         if config.start_date and config.end_date:
-            since = self.format_date_for_jade(config.start_date)
-            until = self.format_date_for_jade(config.end_date)
+            since = format_date_for_jade(config.start_date)
+            until = format_date_for_jade(config.end_date)
             if since and until:
                 date_part = f":effective.since={since}:effective.until={until}"
 
-        # Build page parameter
-        page_part = f"page={page}" if page > 0 else ""
-
         # Build court filter
         court_part = f":collection.journalGroupName={config.court_name}" if config.court_name else ""
 
-        # Combine all parts
-        url = f"https://jade.io/search/{page_part}{court_part}{date_part}:text={query_part}"
-        return url
+        return f"{court_part}{date_part}:text={query_part}"
 
-    def setup_driver(self, config: SearchConfig) -> bool:
-        """Initialize and configure the Chrome driver"""
-        opts = Options()
+    def build_search_url(self, config: SearchConfig, page: int = 0) -> str:
+        """Build the search URL for one page of results
 
-        # Basic Chrome options
-        chrome_options = [
-            '--disable-gpu',
-            '--no-sandbox',
-            '--disable-dev-shm-usage',
-            '--disable-blink-features=AutomationControlled',
-            '--disable-extensions',
-            '--disable-plugins',
-            '--disable-images'  # Speed up loading
-        ]
-
-        for option in chrome_options:
-            opts.add_argument(option)
+        The court/date/query suffix never changes within a run, so it is
+        computed once and only the page parameter varies per call.
+        """
+        if self._url_suffix is None:
+            self._url_suffix = self._prepare_url_template(config)
 
-        # Headless mode
-        if config.headless:
-            opts.add_argument("--headless=new")
-        else:
-            opts.add_argument("--start-maximized")
-
-        # PDF download configuration
-        if config.download_pdfs and config.download_dir:
-            prefs = {
-                "plugins.always_open_pdf_externally": True,
-                "download.prompt_for_download": False,
-                "download.default_directory": os.path.abspath(config.download_dir)
-            }
-            opts.add_experimental_option("prefs", prefs)
+        page_part = f"page={page}" if page > 0 else ""
+        return f"https://jade.io/search/{page_part}{self._url_suffix}"
 
+    def setup_driver(self, config: SearchConfig) -> bool:
+        """Initialize and configure the Chrome driver"""
         # Try to use existing Chrome profile first
         try:
-            user_profile = self.get_default_profile_dir()
-            opts.add_argument(f"--user-data-dir={user_profile}")
+            opts = _make_opts(config, user_profile=get_default_profile_dir())
             self.driver = webdriver.Chrome(options=opts)
         except SessionNotCreatedException:
             # Fallback to fresh Chrome instance
             logging.info("Using fallback Chrome options")
-            fallback_opts = Options()
-            for option in chrome_options:
-                fallback_opts.add_argument(option)
-
-            if config.headless:
-                fallback_opts.add_argument('--headless=new')
-            else:
-                fallback_opts.add_argument("--start-maximized")
-
-            if config.download_pdfs and config.download_dir:
-                fallback_opts.add_experimental_option("prefs", prefs)
+            self.driver = webdriver.Chrome(options=_make_opts(config))
 
-            self.driver = webdriver.Chrome(options=fallback_opts)
+        # Block heavy static resources on the search driver; only the
+        # result anchors and pagination text are ever read from it
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                '*.woff', '*.woff2', '*.ttf', '*.css',
+                '*google-analytics*', '*doubleclick*'
+            ]})
+        except WebDriverException as e:
+            logging.warning(f"Could not enable CDP resource blocking: {e}")
 
         # Set timeouts
         self.driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
         self.wait = WebDriverWait(self.driver, config.wait_time)
         self.browser_start_time = datetime.now()
+        self.driver_config_key = (
+            config.headless, config.download_pdfs, config.download_dir)
         return True
 
-    def filter_links(self, links: List[str]) -> List[str]:
-        """Filter out unwanted links based on excluded patterns"""
-        return [link for link in links if link and not any(re.search(pat, link) for pat in EXCLUDED_PATTERNS)]
+    def _get_driver(self, config: SearchConfig) -> bool:
+        """Reuse the warm driver from a previous search when possible
+
+        Chrome startup costs several seconds; keep the browser alive
+        between searches and only rebuild it when the driver-relevant
+        settings change, the restart interval has elapsed, or the cached
+        instance turns out to be dead.
+        """
+        key = (config.headless, config.download_pdfs, config.download_dir)
+        if self.driver and self.driver_config_key == key:
+            if self.should_restart_browser():
+                # Unhealthy but same settings: recycle in place first;
+                # restart_browser falls back to quit + setup on its own
+                if self.restart_browser(config):
+                    self.wait = WebDriverWait(self.driver, config.wait_time)
+                    return True
+            else:
+                try:
+                    # Cheap socket check first, then a real round trip; a
+                    # connectable chromedriver can still front a dead tab
+                    if self.driver.service.is_connectable():
+                        _ = self.driver.current_url  # liveness probe
+                        self.wait = WebDriverWait(
+                            self.driver, config.wait_time)
+                        return True
+                    logging.info("Cached driver service is not connectable")
+                except WebDriverException:
+                    logging.info("Cached driver is dead, creating a new one")
+
+        self.shutdown()
+        return self.setup_driver(config)
+
+    def create_download_driver(self, config: SearchConfig, download_dir: str):
+        """Create a headless Chrome instance for a single download worker"""
+        opts = Options()
+        for option in CHROME_ARGS:
+            opts.add_argument(option)
+
+        if config.headless:
+            opts.add_argument("--headless=new")
+
+        # Fresh throwaway profile per worker; sharing the user profile
+        # across concurrent Chrome instances is not allowed
+        profile_dir = tempfile.mkdtemp(prefix='jade_worker_')
+        opts.add_argument(f"--user-data-dir={profile_dir}")
 
-    def extract_links_from_page(self) -> List[str]:
-        """Extract case links from current page"""
+        prefs = {
+            "plugins.always_open_pdf_externally": True,
+            "download.prompt_for_download": False,
+            "download.default_directory": os.path.abspath(download_dir)
+        }
+        opts.add_experimental_option("prefs", prefs)
+
+        try:
+            driver = webdriver.Chrome(options=opts)
+        except WebDriverException:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+        driver.set_page_load_timeout(DEFAULT_PAGE_LOAD_TIMEOUT)
+
+        # Point the live session at the worker's folder via CDP; unlike
+        # the prefs above this can be changed without a browser restart
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            raw_links = [
-                a.get('href') for a in soup.find_all('a', class_='gwt-Hyperlink alcina-NoHistory')
-                if a.get('href')
+            driver.execute_cdp_cmd("Page.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": os.path.abspath(download_dir)})
+        except WebDriverException as e:
+            logging.debug(f"Page.setDownloadBehavior unavailable: {e}")
+
+        return driver, profile_dir
+
+    def extract_links_from_page(self, seen: Optional[dict] = None) -> List[str]:
+        """Extract case links from current page
+
+        When a `seen` dict is given, already-known links are dropped and
+        new ones are registered in it during the same pass.
+        """
+        try:
+            # One JS call returns just the hrefs; filtering,
+            # absolutizing and dedup happen in a single pass
+            hrefs = self.driver.execute_script(_LINKS_JS)
+            links = []
+            for h in hrefs:
+                if not h or any(b in h for b in EXCLUDED_LITERALS):
+                    continue
+                if not h.startswith('http'):
+                    h = f"https://jade.io{h}"
+                if seen is not None:
+                    key = _canon(h)
+                    if key in seen:
+                        continue
+                    seen[key] = h
+                links.append(h)
+            return links
+        except Exception as e:
+            logging.error(f"Error extracting links: {e}")
+            return []
+
+    def build_http_session(self) -> requests.Session:
+        """Create a cached requests session carrying the browser's cookies
+
+        Responses are cached for an hour so re-running a query (e.g. after
+        fixing a date range) does not refetch every result page, and
+        repeated requests for the same URL within a run are served
+        locally. PDF downloads go through Selenium and are never cached.
+        """
+        session = requests_cache.CachedSession(
+            cache_name='jade_cache', backend='sqlite', expire_after=3600)
+
+        # Present the same UA the browser authenticated with
+        try:
+            user_agent = self.driver.execute_script(
+                'return navigator.userAgent')
+        except WebDriverException:
+            user_agent = (
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                'AppleWebKit/537.36 (KHTML, like Gecko) '
+                'Chrome/120.0.0.0 Safari/537.36'
+            )
+        session.headers.update({'User-Agent': user_agent})
+
+        # One pooled connection set sized for the page-fetch thread pool
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=10)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(
+                cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        return session
+
+    def _fetch_page_via_driver(self, url: str) -> List[str]:
+        """Render one result page in the browser
+
+        Fallback for when an HTTP fetch comes back as the bare GWT shell
+        with no server-rendered links. Serialized on a lock because the
+        page-fetch threads share the single search driver.
+        """
+        with self._driver_lock:
+            self._navigate_search(url)
+            try:
+                self.wait.until(EC.presence_of_element_located(WAIT_LINKS))
+            except TimeoutException:
+                logging.warning(
+                    "Timed out waiting for search results to render")
+            return self.extract_links_from_page()
+
+    def extract_links_from_html(self, html: str) -> List[str]:
+        """Extract case links from an HTTP-fetched search results page"""
+        try:
+            # Lexbor parses the page in C with a fraction of the
+            # allocations; filtering and absolutizing share one pass
+            tree = LexborHTMLParser(html)
+            hrefs = (
+                node.attributes.get('href')
+                for node in tree.css(_LINK_SELECTOR))
+            return [
+                h if h.startswith('http') else f"https://jade.io{h}"
+                for h in hrefs
+                if h and not any(b in h for b in EXCLUDED_LITERALS)
             ]
-            return self.filter_links(raw_links)
         except Exception as e:
             logging.error(f"Error extracting links: {e}")
             return []
 
+    def _navigate_search(self, url: str):
+        """Navigate the warm driver to a search URL
+
+        When the jade.io GWT app is already loaded (warm driver from a
+        previous search), swapping the URL via history.pushState avoids
+        re-downloading the whole app bundle. If the app ignores the
+        popstate event the link list never changes, so we fall back to a
+        full driver.get.
+        """
+        first_href_js = (
+            f"const a = document.querySelector('{_LINK_SELECTOR}');"
+            "return a ? a.getAttribute('href') : null")
+
+        try:
+            on_jade = self.driver.current_url.startswith('https://jade.io')
+        except WebDriverException:
+            on_jade = False
+
+        if on_jade:
+            try:
+                previous = self.driver.execute_script(first_href_js)
+                self.driver.execute_script(
+                    "window.history.pushState({}, '', arguments[0]);"
+                    "window.dispatchEvent(new PopStateEvent('popstate'));",
+                    url)
+                WebDriverWait(self.driver, 3).until(
+                    lambda d: d.execute_script(first_href_js) != previous)
+                return
+            except (TimeoutException, WebDriverException):
+                logging.info(
+                    "pushState navigation ignored, falling back to full load")
+
+        self.driver.get(url)
+
     def get_total_pages(self) -> int:
         """Extract total number of pages from search results"""
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            text = soup.get_text()
-            match = re.search(r"You are on page \d+ of (\d+)", text)
+            # The regex runs inside the page; only the integer comes back
+            return int(self.driver.execute_script(_PAGES_JS))
+        except WebDriverException as e:
+            logging.warning(f"In-page pagination query failed: {e}")
+
+        try:
+            # The phrase is literal, so the precompiled regex can scan
+            # the raw HTML directly — no tree build, no text concat
+            match = _PAGE_RE.search(self.driver.page_source)
             return int(match.group(1)) if match else 1
         except Exception as e:
             logging.error(f"Error getting total pages: {e}")
             return 1
 
-    def download_pdf(self, link: str, config: SearchConfig, index: int = 0, total: int = 0) -> Tuple[bool, str]:
+    @staticmethod
+    def _wait_for_download(download_dir: str, before: set, timeout: float = 10.0) -> Optional[str]:
+        """Poll download_dir until a new, fully written file appears
+
+        Chrome writes in-progress downloads as *.crdownload; returns the
+        new file's name once it exists without that suffix, or None on
+        timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with os.scandir(download_dir) as entries:
+                names = {entry.name for entry in entries}
+            new_files = names - before
+            if new_files and not any(n.endswith('.crdownload') for n in new_files):
+                return next(iter(new_files))
+            time.sleep(0.1)
+        return None
+
+    def download_pdf(self, link: str, config: SearchConfig, index: int = 0, total: int = 0,
+                     session: Optional[DriverSession] = None,
+                     cache: Optional[CaseCache] = None) -> Tuple[bool, str]:
         """Download PDF for a single case with timing"""
-        full_url = link if link.startswith(
-            'http') else f"https://jade.io{link}"
+        driver = session.driver if session else self.driver
+        wait = session.wait if session else self.wait
+        download_dir = session.download_dir if session else config.download_dir
+        # Links are normalized to absolute URLs at extraction time
+        full_url = link
 
-        # Start timing for this download
-        download_timer = TimingInfo(datetime.now())
+        # time.monotonic avoids a datetime allocation per download and
+        # is immune to wall-clock adjustments
+        t0 = time.monotonic()
 
         try:
-            self.driver.get(full_url)
-            time.sleep(config.wait_time)
+            driver.get(full_url)
 
-            # Wait for and click the Print and Export tab
-            tab = self.wait.until(
+            # The explicit wait on the Print and Export tab doubles as
+            # the page-ready signal, so no fixed sleep is needed here
+            tab = wait.until(
                 EC.element_to_be_clickable(
                     (By.XPATH,
                      "//button[@role='tab'][.//img[@title='Print and Export']]")
                 )
             )
-            tab.click()
 
-            # Wait for and click the PDF download button
-            pdf_button = self.wait.until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, 'a.button-grey.b-pdf'))
-            )
-            pdf_button.click()
-            time.sleep(3)  # Allow time for download to start
+            # Prefer one CDP call over the four-step UI export; fall back
+            # to clicking through the tab if the CDP surface is missing
+            exported = False
+            if download_dir:
+                try:
+                    result = driver.execute_cdp_cmd(
+                        "Page.printToPDF",
+                        {"printBackground": True, "preferCSSPageSize": True})
+                    filename = _case_filename(full_url)
+                    with open(os.path.join(download_dir, filename), 'wb') as f:
+                        f.write(base64.b64decode(result['data']))
+                    if cache:
+                        cache.put(link, os.path.join(
+                            config.download_dir, filename))
+                    exported = True
+                except WebDriverException as e:
+                    logging.info(
+                        f"Page.printToPDF unavailable, using UI export: {e}")
+
+            if not exported:
+                tab.click()
+
+                # Wait for and click the PDF download button
+                pdf_button = wait.until(
+                    EC.element_to_be_clickable(
+                        (By.CSS_SELECTOR, 'a.button-grey.b-pdf'))
+                )
+                before = set(os.listdir(download_dir)
+                             ) if download_dir else set()
+                pdf_button.click()
+
+                # Wait for the file to actually land instead of sleeping
+                if download_dir:
+                    filename = self._wait_for_download(download_dir, before)
+                    if filename is None:
+                        elapsed_str = _format_elapsed(
+                            int(time.monotonic() - t0))
+                        if session:
+                            session.failures += 1
+
+                        if config.progress_callback:
+                            config.progress_callback(
+                                f"Failed {index}/{total} - {elapsed_str} - {full_url}")
+
+                        logging.warning(
+                            f"Download did not complete in time ({elapsed_str}): {full_url}")
+                        return False, f"Download timed out ({elapsed_str})"
+                    if cache:
+                        # Record the post-merge location in the requested folder
+                        cache.put(link, os.path.join(
+                            config.download_dir, filename))
+                else:
+                    time.sleep(3)  # No folder to watch; allow time to start
 
             # End timing
-            download_timer.end_time = datetime.now()
+            elapsed_str = _format_elapsed(int(time.monotonic() - t0))
+            if session:
+                session.failures = 0
 
             # Update progress if callback provided
             if config.progress_callback:
-                progress_msg = f"Downloaded {index}/{total} - {download_timer.elapsed_str} - {full_url}"
+                progress_msg = f"Downloaded {index}/{total} - {elapsed_str} - {full_url}"
                 config.progress_callback(progress_msg)
 
             logging.info(
-                f"Downloaded PDF ({download_timer.elapsed_str}): {full_url}")
-            return True, f"Success ({download_timer.elapsed_str})"
+                f"Downloaded PDF ({elapsed_str}): {full_url}")
+            return True, f"Success ({elapsed_str})"
 
         except (TimeoutException, NoSuchElementException, WebDriverException) as e:
-            download_timer.end_time = datetime.now()
-            error_msg = f"Failed ({download_timer.elapsed_str}): {str(e)[:50]}..."
+            elapsed_str = _format_elapsed(int(time.monotonic() - t0))
+            if session:
+                session.failures += 1
+            error_msg = f"Failed ({elapsed_str}): {str(e)[:50]}..."
 
             if config.progress_callback:
-                progress_msg = f"Failed {index}/{total} - {download_timer.elapsed_str} - {full_url}"
+                progress_msg = f"Failed {index}/{total} - {elapsed_str} - {full_url}"
                 config.progress_callback(progress_msg)
 
             logging.warning(
-                f"Could not download PDF ({download_timer.elapsed_str}) from {full_url}: {e}")
+                f"Could not download PDF ({elapsed_str}) from {full_url}: {e}")
             return False, error_msg
 
     def scrape_case_links(self, config: SearchConfig) -> Tuple[List[str], List[str]]:
         """Main scraping method that returns links and failed downloads"""
+        _load_heavy_imports()
+
         # Start total timer
         self.total_timer = TimingInfo(datetime.now())
 
-        if not self.setup_driver(config):
+        # New run, new search parameters: drop the cached URL suffix
+        self._url_suffix = None
+
+        if not self._get_driver(config):
             return [], ["Failed to initialize browser"]
 
-        all_links = []
+        all_links: List[str] = []
         failed_downloads = []
-        seen_links: Set[str] = set()
+        # Insertion-ordered canonical-key -> link dict doubles as dedup
+        # set and result list
+        seen_links: dict = {}
 
         try:
             # Start search timer
@@ -331,64 +873,95 @@ class JadeScraper:
             if config.progress_callback:
                 config.progress_callback("Starting search...")
 
-            # Get first page
+            # Get first page; wait for the result anchors instead of a
+            # blind sleep so fast pages are not padded with idle time
             url = self.build_search_url(config)
-            self.driver.get(url)
-            time.sleep(config.wait_time)
+            self._navigate_search(url)
+            try:
+                self.wait.until(EC.presence_of_element_located(WAIT_LINKS))
+            except TimeoutException:
+                logging.warning(
+                    "Timed out waiting for search results to render")
 
-            # Extract links from first page
-            links = self.extract_links_from_page()
-            all_links.extend(links)
-            seen_links.update(links)
+            # Extract links from first page, deduping as they stream in
+            first_links = self.extract_links_from_page(seen_links)
+            if config.link_callback:
+                for link in first_links:
+                    config.link_callback(link)
 
             # Get total pages for pagination
             total_pages = self.get_total_pages()
             logging.info(f"Found {total_pages} pages of results")
 
+            # Remaining pages are plain HTTP fetches; the browser's session
+            # cookies let requests retrieve them without rendering
+            self.session = self.build_http_session()
+
             if config.progress_callback:
                 config.progress_callback(
                     f"Found {total_pages} pages to process...")
 
-            # Process remaining pages
-            for page in range(1, total_pages):
-                try:
-                    # Check if browser needs restart
-                    if self.should_restart_browser():
-                        if not self.restart_browser(config):
-                            logging.error(
-                                "Failed to restart browser, stopping pagination")
-                            break
-
-                    if config.progress_callback:
-                        elapsed = TimingInfo(
-                            self.search_timer.start_time).elapsed_str
-                        config.progress_callback(
-                            f"Processing page {page + 1}/{total_pages} - {elapsed} elapsed")
-
-                    url = self.build_search_url(config, page)
-                    self.driver.get(url)
-                    time.sleep(config.wait_time)
-
-                    links = self.extract_links_from_page()
-                    new_links = [
-                        link for link in links if link not in seen_links]
-
-                    if not new_links:
-                        logging.info(
-                            f"No new links found on page {page + 1}, stopping pagination")
+            # Process remaining pages concurrently; each fetch is
+            # independent I/O so a thread pool overlaps server latency
+            if total_pages > 1:
+                if config.progress_callback:
+                    config.progress_callback(
+                        f"Fetching pages 2-{total_pages} in parallel...")
+
+                def fetch_page(page: int) -> List[str]:
+                    try:
+                        url = self.build_search_url(config, page)
+                        response = self.session.get(url, timeout=30)
+                        links = self.extract_links_from_html(response.text)
+                        if not links and 'gwt-Hyperlink' not in response.text:
+                            # Got the bare JS shell; render it for real
+                            return self._fetch_page_via_driver(url)
+                        return links
+                    except Exception as e:
+                        logging.warning(
+                            f"Error processing page {page + 1}: {e}")
+                        return []
+
+                # Exponential probe (1, 2, 4, 8, ...) finds the last page
+                # that still yields new links, so an over-reported total
+                # doesn't cost a fetch per phantom tail page
+                page_links = {}
+                bound = total_pages
+                probe = 1
+                while probe < total_pages:
+                    links = fetch_page(probe)
+                    page_links[probe] = links
+                    if not links or all(_canon(l) in seen_links for l in links):
+                        bound = probe
                         break
-
-                    all_links.extend(new_links)
-                    seen_links.update(new_links)
+                    probe *= 2
+
+                # Fill the un-probed gaps below the bound in parallel
+                remaining = [
+                    p for p in range(1, bound) if p not in page_links]
+                if remaining:
+                    with ThreadPoolExecutor(max_workers=8) as executor:
+                        for p, links in zip(
+                                remaining, executor.map(fetch_page, remaining)):
+                            page_links[p] = links
+
+                # Merge in page order so result ordering stays stable;
+                # one pass inserts and counts the genuinely new links
+                for page, links in sorted(page_links.items()):
+                    new_count = 0
+                    for link in links:
+                        key = _canon(link)
+                        if key not in seen_links:
+                            seen_links[key] = link
+                            new_count += 1
+                            if config.link_callback:
+                                config.link_callback(link)
 
                     logging.info(
-                        f"Processed page {page + 1}/{total_pages}, found {len(new_links)} new links")
-
-                except Exception as e:
-                    logging.warning(f"Error processing page {page + 1}: {e}")
-                    break
+                        f"Processed page {page + 1}/{total_pages}, found {new_count} new links")
 
             # End search timer
+            all_links = list(seen_links.values())
             self.search_timer.end_time = datetime.now()
 
             if config.progress_callback:
@@ -404,46 +977,77 @@ class JadeScraper:
                     config.progress_callback(
                         f"Starting PDF downloads for {len(all_links)} links...")
 
-                download_start_time = datetime.now()
+                download_start = time.monotonic()
                 successful_downloads = 0
+                total_links = len(all_links)
+
+                cache = CaseCache(
+                    config.download_dir) if config.use_cache else None
+
+                # A pool of pre-initialized browsers, each with its own
+                # download subfolder to avoid filename races
+                try:
+                    pool = DriverPool(
+                        self, config, min(DOWNLOAD_WORKERS, total_links))
+                except (WebDriverException, OSError) as e:
+                    logging.error(f"Could not start download workers: {e}")
+                    failed_downloads.append(
+                        "Download workers failed to start")
+                    pool = None
+
+                def download_task(numbered_link):
+                    i, link = numbered_link
+
+                    # Skip cases whose PDF already exists from a past run
+                    if cache:
+                        cached_path = cache.get(link)
+                        if cached_path and os.path.exists(cached_path):
+                            logging.info(f"Already downloaded: {link}")
+                            return i, link, True, "Cached"
+
+                    session = pool.acquire()
+                    try:
+                        success, result_msg = self.download_pdf(
+                            link, config, i, total_links,
+                            session=session, cache=cache)
+                    finally:
+                        pool.release(session)
+                    return i, link, success, result_msg
+
+                try:
+                    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+                        results = executor.map(
+                            download_task, enumerate(all_links, 1)) if pool else []
+                        for i, link, success, result_msg in results:
+                            if success:
+                                successful_downloads += 1
+                            else:
+                                failed_downloads.append(
+                                    f"Link {i}: {link} - {result_msg}")
+
+                            # Update overall download progress; the ETA
+                            # math only runs when a message is emitted
+                            if config.progress_callback and i % 5 == 0:  # Update every 5 downloads
+                                download_elapsed = (
+                                    time.monotonic() - download_start)
+                                avg_time_per_download = download_elapsed / i
+                                estimated_remaining = avg_time_per_download * \
+                                    (total_links - i)
+
+                                remaining_str = str(
+                                    timedelta(seconds=int(estimated_remaining)))
+                                config.progress_callback(
+                                    f"Downloads: {successful_downloads}/{i} successful - "
+                                    f"Est. remaining: {remaining_str}"
+                                )
+                finally:
+                    if pool:
+                        pool.close(merge_into=config.download_dir)
+                    if cache:
+                        cache.close()
 
-                for i, link in enumerate(all_links, 1):
-                    # Check if browser needs restart during downloads
-                    if self.should_restart_browser():
-                        if not self.restart_browser(config):
-                            logging.error(
-                                "Failed to restart browser during downloads")
-                            failed_downloads.append(
-                                f"Link {i}: {link} - Browser restart failed")
-                            continue
-
-                    success, result_msg = self.download_pdf(
-                        link, config, i, len(all_links))
-
-                    if success:
-                        successful_downloads += 1
-                    else:
-                        failed_downloads.append(
-                            f"Link {i}: {link} - {result_msg}")
-
-                    # Update overall download progress
-                    if config.progress_callback and i % 5 == 0:  # Update every 5 downloads
-                        download_elapsed = (
-                            datetime.now() - download_start_time).total_seconds()
-                        avg_time_per_download = download_elapsed / i
-                        estimated_remaining = avg_time_per_download * \
-                            (len(all_links) - i)
-
-                        remaining_str = str(
-                            timedelta(seconds=int(estimated_remaining)))
-                        config.progress_callback(
-                            f"Downloads: {successful_downloads}/{i} successful - "
-                            f"Est. remaining: {remaining_str}"
-                        )
-
-                download_total_time = datetime.now() - download_start_time
                 download_time_str = str(
-                    timedelta(seconds=int(download_total_time.total_seconds())))
+                    timedelta(seconds=int(time.monotonic() - download_start)))
 
                 if config.progress_callback:
                     config.progress_callback(
@@ -466,29 +1070,76 @@ class JadeScraper:
 
             self.cleanup()
 
-        # Convert relative links to absolute URLs
-        absolute_links = [
-            link if link.startswith('http') else f"https://jade.io{link}"
-            for link in all_links
-        ]
+        return all_links, failed_downloads
 
-        return absolute_links, failed_downloads
+    def _driver_rss(self) -> int:
+        """Total resident memory of chromedriver and its children, in bytes"""
+        try:
+            proc = psutil.Process(self.driver.service.process.pid)
+            return proc.memory_info().rss + sum(
+                child.memory_info().rss
+                for child in proc.children(recursive=True))
+        except (psutil.Error, AttributeError) as e:
+            logging.debug(f"Could not read driver memory: {e}")
+            return 0
 
     def should_restart_browser(self) -> bool:
-        """Check if browser should be restarted based on elapsed time"""
+        """Check browser health: runaway memory or age
+
+        Pure wall-time restarts recycle perfectly healthy drivers, so
+        RSS is consulted first. Download failures are tracked per pool
+        worker and handled by DriverPool.release instead.
+        """
         if not self.browser_start_time:
             return False
 
+        if self._driver_rss() > DRIVER_RSS_LIMIT:
+            logging.info("Restarting browser due to memory usage")
+            return True
+
         elapsed = (datetime.now() - self.browser_start_time).total_seconds()
         return elapsed >= self.browser_restart_interval
 
+    def soft_restart(self) -> bool:
+        """Recycle the renderer without tearing down chromedriver
+
+        Opening a fresh tab and closing the old one drops the render
+        process (and most of its memory) while keeping the chromedriver
+        process, session, and cookies alive — much cheaper than a full
+        quit + setup cycle.
+        """
+        try:
+            last_url = self.driver.current_url
+            old_handle = self.driver.current_window_handle
+
+            self.driver.execute_script("window.open('about:blank', '_blank');")
+            new_handle = [
+                h for h in self.driver.window_handles if h != old_handle][-1]
+            self.driver.switch_to.window(old_handle)
+            self.driver.close()
+            self.driver.switch_to.window(new_handle)
+            self.driver.get(last_url)
+
+            self.browser_start_time = datetime.now()
+            return True
+        except WebDriverException as e:
+            logging.warning(f"Soft restart failed: {e}")
+            return False
+
     def restart_browser(self, config: SearchConfig) -> bool:
         """Restart the browser to prevent memory issues"""
         try:
             if config.progress_callback:
-                config.progress_callback("Restarting browser after 1 hour...")
+                config.progress_callback("Restarting browser...")
+
+            logging.info("Restarting browser")
 
-            logging.info("Restarting browser after half hour of operation")
+            # A renderer recycle is enough unless chromedriver itself
+            # has grown past the memory limit
+            if self._driver_rss() <= DRIVER_RSS_LIMIT and self.soft_restart():
+                if config.progress_callback:
+                    config.progress_callback("Browser tab recycled")
+                return True
 
             # Clean up current driver
             if self.driver:
@@ -515,7 +1166,14 @@ class JadeScraper:
             return False
 
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up per-run resources; the browser stays warm for reuse"""
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def shutdown(self):
+        """Quit the browser and release everything (app exit or rebuild)"""
+        self.cleanup()
         if self.driver:
             try:
                 self.driver.quit()
@@ -525,6 +1183,7 @@ class JadeScraper:
                 self.driver = None
                 self.wait = None
                 self.browser_start_time = None
+                self.driver_config_key = None
 
 
 class JadeScraperGUI:
@@ -533,12 +1192,19 @@ class JadeScraperGUI:
     def __init__(self):
         self.root = tk.Tk()
         self.scraper = JadeScraper()
+        self.progress_queue: queue.Queue = queue.Queue()
+        self.link_queue: queue.Queue = queue.Queue()
         self.setup_ui()
 
+        # Drain progress messages at ~10 Hz so the scraper thread never
+        # blocks on Tk repaints
+        self.root.after(100, self._drain_progress_queue)
+
     def setup_ui(self):
         """Initialize the user interface"""
         self.root.title("Jade.io Case Scraper")
         self.root.geometry("900x700")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Main frame
         self.frame = ttk.Frame(self.root, padding=10)
@@ -679,6 +1345,11 @@ class JadeScraperGUI:
         self.start_time = None
         self.update_elapsed_time()
 
+    def on_close(self):
+        """Quit the warm browser before closing the window"""
+        self.scraper.shutdown()
+        self.root.destroy()
+
     def browse_folder(self):
         """Open folder selection dialog"""
         folder = filedialog.askdirectory()
@@ -706,11 +1377,65 @@ class JadeScraperGUI:
         self.root.after(1000, self.update_elapsed_time)
 
     def update_progress_log(self, message: str):
-        """Update the progress log with timestamp"""
+        """Queue a progress message; safe to call from worker threads"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.progress_box.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.progress_box.see(tk.END)  # Auto-scroll to bottom
-        self.root.update_idletasks()  # Force GUI update
+        self.progress_queue.put(f"[{timestamp}] {message}\n")
+
+    def stream_link(self, link: str):
+        """Queue a discovered link for display; thread-safe"""
+        self.link_queue.put(f"{link}\n")
+
+    def _finalize_results(self, text: str):
+        """Replace the streamed link view with the final report
+
+        Runs on the Tk main loop. Any links still queued are discarded
+        first — they are already in the report — so a drain tick can
+        never append them after the summary.
+        """
+        try:
+            while True:
+                self.link_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        self.output_box.delete("1.0", tk.END)
+        self.output_box.insert(tk.END, text)
+
+    def _ui(self, fn, *args, **kwargs):
+        """Marshal a UI mutation onto the Tk main loop
+
+        Tk is not thread-safe; the scraper thread must never touch
+        widgets directly.
+        """
+        self.root.after(0, lambda: fn(*args, **kwargs))
+
+    def _drain_progress_queue(self):
+        """Flush queued progress messages into the log in one batch"""
+        lines = []
+        try:
+            while len(lines) < 50:
+                lines.append(self.progress_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.progress_box.insert(tk.END, "".join(lines))
+            self.progress_box.see(tk.END)  # Auto-scroll to bottom
+
+        # Stream newly discovered links on the same tick so results
+        # appear as the search runs instead of after it finishes
+        links = []
+        try:
+            while len(links) < 50:
+                links.append(self.link_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if links:
+            self.output_box.insert(tk.END, "".join(links))
+            self.output_box.see(tk.END)
+
+        self.root.after(100, self._drain_progress_queue)
 
     def validate_inputs(self, config: SearchConfig) -> bool:
         """Validate user inputs before starting scraper"""
@@ -761,45 +1486,47 @@ class JadeScraperGUI:
             wait_time=wait_time,
             download_pdfs=self.download_var.get(),
             download_dir=self.download_dir_var.get().strip() or None,
-            progress_callback=self.update_progress_log
+            progress_callback=self.update_progress_log,
+            link_callback=self.stream_link
         )
 
     def run_scraper(self):
         """Start the scraping process in a separate thread"""
-        def scraper_task():
-            config = self.get_search_config()
+        # Read the widgets here on the main thread; the worker gets the
+        # frozen config via its closure and never touches Tk variables
+        config = self.get_search_config()
+        if not self.validate_inputs(config):
+            return
 
+        def scraper_task():
             try:
                 # Run the scraper
                 links, failed_downloads = self.scraper.scrape_case_links(
                     config)
 
-                # Update UI with results
-                self.output_box.delete("1.0", tk.END)
-
+                # Build the report once; one insert avoids a Tk
+                # re-layout per line on large result sets
+                report = []
                 if not links and not failed_downloads:
-                    self.output_box.insert(tk.END,
-                                           "No links found. Try increasing the wait time or checking your search terms.")
+                    report.append(
+                        "No links found. Try increasing the wait time or checking your search terms.")
                 elif failed_downloads and "Page timed out" in failed_downloads:
-                    self.output_box.insert(tk.END,
-                                           "Scraper stopped. Page took too long to load (60 seconds max).")
+                    report.append(
+                        "Scraper stopped. Page took too long to load (60 seconds max).")
                 elif failed_downloads and "Scraper stopped abruptly" in failed_downloads:
-                    self.output_box.insert(tk.END,
-                                           "Scraper stopped abruptly (browser may have been closed).")
+                    report.append(
+                        "Scraper stopped abruptly (browser may have been closed).")
                 else:
-                    # Display successful links
                     if links:
-                        self.output_box.insert(
-                            tk.END, f"Found {len(links)} case links:\n\n")
-                        for i, link in enumerate(links, 1):
-                            self.output_box.insert(tk.END, f"{i}. {link}\n")
+                        report.append(f"Found {len(links)} case links:\n\n")
+                        report.extend(
+                            f"{i}. {link}\n" for i, link in enumerate(links, 1))
 
-                    # Display failed downloads if any
                     if failed_downloads:
-                        self.output_box.insert(
-                            tk.END, f"\n\nFailed Downloads ({len(failed_downloads)}):\n")
-                        for failure in failed_downloads:
-                            self.output_box.insert(tk.END, f"• {failure}\n")
+                        report.append(
+                            f"\n\nFailed Downloads ({len(failed_downloads)}):\n")
+                        report.extend(
+                            f"• {failure}\n" for failure in failed_downloads)
 
                 # Add final timing summary
                 if self.scraper.total_timer:
@@ -807,24 +1534,23 @@ class JadeScraperGUI:
                     if self.scraper.search_timer and self.scraper.search_timer.end_time:
                         summary += f"Search phase: {self.scraper.search_timer.elapsed_str}\n"
                     summary += f"Total operation: {self.scraper.total_timer.elapsed_str}\n"
-                    self.output_box.insert(tk.END, summary)
+                    report.append(summary)
+
+                # One callback clears the streamed view and shows the
+                # report, so late-queued links can't trail the summary
+                self._ui(self._finalize_results, "".join(report))
 
             except Exception as e:
-                messagebox.showerror(
-                    "Error", f"An unexpected error occurred: {str(e)}")
+                self._ui(messagebox.showerror,
+                         "Error", f"An unexpected error occurred: {str(e)}")
                 logging.error(f"Scraper error: {e}")
             finally:
                 # Reset UI state
-                self.progress_bar.stop()
-                self.status_label.config(text="Done")
-                self.search_button.config(state="normal")
+                self._ui(self.progress_bar.stop)
+                self._ui(self.status_label.config, text="Done")
+                self._ui(self.search_button.config, state="normal")
                 self.start_time = None  # Stop elapsed time counter
 
-        # Validate inputs
-        config = self.get_search_config()
-        if not self.validate_inputs(config):
-            return
-
         # Clear previous results
         self.output_box.delete("1.0", tk.END)
         self.progress_box.delete("1.0", tk.END)